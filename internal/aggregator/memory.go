@@ -1,6 +1,7 @@
 package aggregator
 
 import (
+	"strings"
 	"sync"
 	"time"
 
@@ -305,8 +306,8 @@ func (a *MemoryAggregator) Search(query string, limit int) []LogEntry {
 			continue
 		}
 
-		// Simple string search in message
-		if contains(entry.Message, query) {
+		// Substring search in message
+		if strings.Contains(entry.Message, query) {
 			result = append(result, entry)
 			count++
 		}
@@ -319,23 +320,3 @@ func (a *MemoryAggregator) Search(query string, limit int) []LogEntry {
 func generateLogID(entry LogEntry) string {
 	return entry.Timestamp.Format("20060102-150405.000000000")
 }
-
-// contains checks if a string contains a substring (case-insensitive)
-func contains(s, substr string) bool {
-	return len(s) >= len(substr) &&
-		(s == substr ||
-			len(s) > len(substr) &&
-				(s[:len(substr)] == substr ||
-					s[len(s)-len(substr):] == substr ||
-					containsSubstring(s, substr)))
-}
-
-// containsSubstring is a simple substring search
-func containsSubstring(s, substr string) bool {
-	for i := 0; i <= len(s)-len(substr); i++ {
-		if s[i:i+len(substr)] == substr {
-			return true
-		}
-	}
-	return false
-}
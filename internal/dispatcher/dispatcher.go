@@ -224,12 +224,14 @@ func (d *Dispatcher) handleEvent(event Event) {
 		return
 	}
 
-	d.logger.Debug("Processing event", map[string]interface{}{
-		"type":     event.Type,
-		"id":       event.ID,
-		"source":   event.Source,
-		"handlers": len(handlers),
-	})
+	if d.logger.DebugEnabled() {
+		d.logger.Debug("Processing event", map[string]interface{}{
+			"type":     event.Type,
+			"id":       event.ID,
+			"source":   event.Source,
+			"handlers": len(handlers),
+		})
+	}
 
 	// Process with all registered handlers
 	var wg sync.WaitGroup
@@ -301,11 +303,14 @@ func (d *Dispatcher) GetRegisteredHandlers() map[EventType][]string {
 
 // ConvertSboxctlEvent converts a SboxctlEvent to a generic Event
 func ConvertSboxctlEvent(sboxEvent services.SboxctlEvent) Event {
+	// Read the clock once for both the default timestamp and the ID
+	now := time.Now()
+
 	event := Event{
 		Type:      EventType(sboxEvent.Type),
 		Data:      sboxEvent.Data,
 		Source:    "sboxctl",
-		Timestamp: time.Now(), // Will be overridden if timestamp is provided
+		Timestamp: now, // Will be overridden if timestamp is provided
 	}
 
 	// Try to parse timestamp if provided
@@ -317,7 +322,7 @@ func ConvertSboxctlEvent(sboxEvent services.SboxctlEvent) Event {
 
 	// Generate ID if not provided
 	if event.ID == "" {
-		event.ID = fmt.Sprintf("%s-%d", event.Type, time.Now().UnixNano())
+		event.ID = fmt.Sprintf("%s-%d", event.Type, now.UnixNano())
 	}
 
 	return event
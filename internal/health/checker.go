@@ -176,20 +176,50 @@ func (h *HealthChecker) run() {
 
 // performHealthCheck performs all registered health checks
 func (h *HealthChecker) performHealthCheck() {
-	h.mu.RLock()
-	checks := make(map[string]HealthCheck)
-	for k, v := range h.checks {
-		checks[k] = v
-	}
-	h.mu.RUnlock()
-
+	checks := h.snapshotChecks()
 	if len(checks) == 0 {
 		h.logger.Debug("No health checks registered", map[string]interface{}{})
 		return
 	}
 
+	components, ok := h.runChecks(h.ctx, checks)
+	if !ok {
+		return
+	}
+
+	// Generate report
+	report := h.generateReport(components)
+
+	// Store last report
+	h.reportMu.Lock()
+	h.lastReport = report
+	h.reportMu.Unlock()
+
+	// Log overall status
+	h.logger.Info("Health check completed", map[string]interface{}{
+		"overallStatus": report.OverallStatus,
+		"components":    len(report.Components),
+		"summary":       report.Summary,
+	})
+}
+
+// snapshotChecks returns a copy of the registered health checks
+func (h *HealthChecker) snapshotChecks() map[string]HealthCheck {
+	h.mu.RLock()
+	defer h.mu.RUnlock()
+
+	checks := make(map[string]HealthCheck, len(h.checks))
+	for k, v := range h.checks {
+		checks[k] = v
+	}
+	return checks
+}
+
+// runChecks runs the given checks concurrently and collects their results.
+// It returns false if the overall timeout expired before all checks finished.
+func (h *HealthChecker) runChecks(parent context.Context, checks map[string]HealthCheck) ([]ComponentHealth, bool) {
 	// Create context with timeout
-	ctx, cancel := context.WithTimeout(h.ctx, h.timeout)
+	ctx, cancel := context.WithTimeout(parent, h.timeout)
 	defer cancel()
 
 	// Limit concurrent checks to prevent DoS
@@ -246,31 +276,18 @@ func (h *HealthChecker) performHealthCheck() {
 		h.logger.Warn("Health check timeout", map[string]interface{}{
 			"timeout": h.timeout,
 		})
-		return
+		return nil, false
 	}
 
 	close(results)
 
 	// Collect results
-	var components []ComponentHealth
+	components := make([]ComponentHealth, 0, len(checks))
 	for result := range results {
 		components = append(components, result)
 	}
 
-	// Generate report
-	report := h.generateReport(components)
-
-	// Store last report
-	h.reportMu.Lock()
-	h.lastReport = report
-	h.reportMu.Unlock()
-
-	// Log overall status
-	h.logger.Info("Health check completed", map[string]interface{}{
-		"overallStatus": report.OverallStatus,
-		"components":    len(report.Components),
-		"summary":       report.Summary,
-	})
+	return components, true
 }
 
 // generateReport generates a health report from component results
@@ -376,86 +393,16 @@ func (h *HealthChecker) ForceCheck() HealthReport {
 		ctx = context.Background()
 	}
 
-	// Create context with timeout
-	checkCtx, cancel := context.WithTimeout(ctx, h.timeout)
-	defer cancel()
-
-	h.mu.RLock()
-	checks := make(map[string]HealthCheck)
-	for k, v := range h.checks {
-		checks[k] = v
-	}
-	h.mu.RUnlock()
-
+	checks := h.snapshotChecks()
 	if len(checks) == 0 {
 		return h.generateReport([]ComponentHealth{})
 	}
 
-	// Limit concurrent checks to prevent DoS
-	maxConcurrent := 10
-	if len(checks) > maxConcurrent {
-		h.logger.Warn("Too many health checks, limiting concurrent execution", map[string]interface{}{
-			"total":         len(checks),
-			"maxConcurrent": maxConcurrent,
-		})
-	}
-
-	// Run checks with concurrency limit
-	semaphore := make(chan struct{}, maxConcurrent)
-	var wg sync.WaitGroup
-	results := make(chan ComponentHealth, len(checks))
-
-	for name, check := range checks {
-		wg.Add(1)
-		go func(c HealthCheck, n string) {
-			defer wg.Done()
-
-			// Acquire semaphore
-			select {
-			case semaphore <- struct{}{}:
-				defer func() { <-semaphore }()
-			case <-checkCtx.Done():
-				return
-			}
-
-			// Run check with individual timeout
-			individualCtx, individualCancel := context.WithTimeout(checkCtx, h.timeout/2)
-			defer individualCancel()
-
-			result := c.Check(individualCtx)
-			select {
-			case results <- result:
-			case <-checkCtx.Done():
-			}
-		}(check, name)
-	}
-
-	// Wait for all checks to complete with timeout
-	done := make(chan struct{})
-	go func() {
-		wg.Wait()
-		close(done)
-	}()
-
-	// Wait for completion or timeout
-	select {
-	case <-done:
-		// All checks completed
-	case <-checkCtx.Done():
-		h.logger.Warn("Health check timeout", map[string]interface{}{
-			"timeout": h.timeout,
-		})
+	components, ok := h.runChecks(ctx, checks)
+	if !ok {
 		return h.generateReport([]ComponentHealth{})
 	}
 
-	close(results)
-
-	// Collect results
-	var components []ComponentHealth
-	for result := range results {
-		components = append(components, result)
-	}
-
 	// Generate and return report
 	return h.generateReport(components)
 }
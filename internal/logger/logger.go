@@ -75,9 +75,12 @@ func New(level string) (*Logger, error) {
 	}, nil
 }
 
+// DebugEnabled reports whether debug messages are logged
+func (l *Logger) DebugEnabled() bool { return l.level <= DebugLevel }
+
 // Debug logs a debug message
 func (l *Logger) Debug(message string, fields map[string]interface{}) {
-	if l.level <= DebugLevel {
+	if l.DebugEnabled() {
 		l.log(l.debug, "DEBUG", message, fields)
 	}
 }
@@ -105,21 +108,23 @@ func (l *Logger) Error(message string, fields map[string]interface{}) {
 
 // log formats and outputs a log message
 func (l *Logger) log(logger *log.Logger, level, message string, fields map[string]interface{}) {
-	timestamp := time.Now().Format(time.RFC3339)
-	
-	// Build log entry
-	entry := fmt.Sprintf("%s [%s] %s", timestamp, level, message)
-	
+	// Build the whole entry in one buffer and emit it with a single write
+	var entry strings.Builder
+	entry.WriteString(time.Now().Format(time.RFC3339))
+	entry.WriteString(" [")
+	entry.WriteString(level)
+	entry.WriteString("] ")
+	entry.WriteString(message)
+
 	// Add fields if provided
-	if len(fields) > 0 {
-		fieldStrs := make([]string, 0, len(fields))
-		for key, value := range fields {
-			fieldStrs = append(fieldStrs, fmt.Sprintf("%s=%v", key, value))
-		}
-		entry += " " + strings.Join(fieldStrs, " ")
+	for key, value := range fields {
+		entry.WriteByte(' ')
+		entry.WriteString(key)
+		entry.WriteByte('=')
+		fmt.Fprint(&entry, value)
 	}
-	
-	logger.Println(entry)
+
+	logger.Println(entry.String())
 }
 
 // SetLevel sets the logging level
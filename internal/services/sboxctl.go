@@ -2,6 +2,7 @@ package services
 
 import (
 	"bufio"
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
@@ -106,11 +107,21 @@ func (s *SboxctlService) run() {
 		return
 	}
 
+	// Parse timeout once; it does not change for the lifetime of the loop
+	timeout, err := parseDuration(s.config.Timeout)
+	if err != nil {
+		s.logger.Error("Invalid timeout format", map[string]interface{}{
+			"timeout": s.config.Timeout,
+			"error":   err.Error(),
+		})
+		return
+	}
+
 	ticker := time.NewTicker(interval)
 	defer ticker.Stop()
 
 	// Run initial execution
-	s.executeSboxctl()
+	s.executeSboxctl(timeout)
 
 	// Main loop
 	for {
@@ -119,13 +130,13 @@ func (s *SboxctlService) run() {
 			s.logger.Info("Sboxctl service loop stopped", map[string]interface{}{})
 			return
 		case <-ticker.C:
-			s.executeSboxctl()
+			s.executeSboxctl(timeout)
 		}
 	}
 }
 
 // executeSboxctl executes the sboxctl command and captures output
-func (s *SboxctlService) executeSboxctl() {
+func (s *SboxctlService) executeSboxctl(timeout time.Duration) {
 	s.mu.Lock()
 	s.lastRun = time.Now()
 	s.mu.Unlock()
@@ -134,16 +145,6 @@ func (s *SboxctlService) executeSboxctl() {
 		"command": s.config.Command,
 	})
 
-	// Parse timeout
-	timeout, err := parseDuration(s.config.Timeout)
-	if err != nil {
-		s.logger.Error("Invalid timeout format", map[string]interface{}{
-			"timeout": s.config.Timeout,
-			"error":   err.Error(),
-		})
-		return
-	}
-
 	// Create context with timeout
 	ctx, cancel := context.WithTimeout(s.ctx, timeout)
 	defer cancel()
@@ -196,22 +197,26 @@ func (s *SboxctlService) readStdout(stdout interface{}) {
 	scanner := bufio.NewScanner(stdout.(interface{ Read(p []byte) (n int, err error) }))
 	
 	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line == "" {
+		// Work on the scanner's buffer directly so JSON lines are parsed
+		// without an extra string -> []byte copy
+		raw := bytes.TrimSpace(scanner.Bytes())
+		if len(raw) == 0 {
 			continue
 		}
 
-		s.logger.Debug("Received stdout line", map[string]interface{}{
-			"line": line,
-		})
+		if s.logger.DebugEnabled() {
+			s.logger.Debug("Received stdout line", map[string]interface{}{
+				"line": string(raw),
+			})
+		}
 
 		// Try to parse as JSON event
-		if event, err := s.parseEvent(line); err == nil {
+		if event, err := s.parseEvent(raw); err == nil {
 			s.handleEvent(event)
 		} else {
 			// Treat as plain log line
 			s.logger.Info("Sboxctl output", map[string]interface{}{
-				"output": line,
+				"output": string(raw),
 			})
 		}
 	}
@@ -224,9 +229,9 @@ func (s *SboxctlService) readStdout(stdout interface{}) {
 }
 
 // parseEvent attempts to parse a line as a JSON event
-func (s *SboxctlService) parseEvent(line string) (*SboxctlEvent, error) {
+func (s *SboxctlService) parseEvent(line []byte) (*SboxctlEvent, error) {
 	var event SboxctlEvent
-	if err := json.Unmarshal([]byte(line), &event); err != nil {
+	if err := json.Unmarshal(line, &event); err != nil {
 		return nil, err
 	}
 
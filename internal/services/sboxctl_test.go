@@ -78,7 +78,7 @@ func TestSboxctlService_ParseEvent(t *testing.T) {
 
 	// Test valid JSON event
 	validJSON := `{"type":"LOG","data":{"level":"info","message":"test"},"timestamp":"2025-06-27T16:30:00Z","version":"1.0"}`
-	event, err := service.parseEvent(validJSON)
+	event, err := service.parseEvent([]byte(validJSON))
 	require.NoError(t, err)
 	assert.Equal(t, "LOG", event.Type)
 	assert.Equal(t, "1.0", event.Version)
@@ -87,12 +87,12 @@ func TestSboxctlService_ParseEvent(t *testing.T) {
 
 	// Test invalid JSON
 	invalidJSON := `{"type":"LOG","invalid json`
-	_, err = service.parseEvent(invalidJSON)
+	_, err = service.parseEvent([]byte(invalidJSON))
 	assert.Error(t, err)
 
 	// Test missing type
 	noTypeJSON := `{"data":{"level":"info"},"timestamp":"2025-06-27T16:30:00Z","version":"1.0"}`
-	_, err = service.parseEvent(noTypeJSON)
+	_, err = service.parseEvent([]byte(noTypeJSON))
 	assert.Error(t, err)
 	assert.Contains(t, err.Error(), "event type is required")
 }
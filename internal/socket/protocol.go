@@ -152,13 +152,13 @@ func EncodeMessage(msg *Message) ([]byte, error) {
 		return nil, fmt.Errorf("message too large: %d bytes (max: %d)", len(data), MaxMessageSize)
 	}
 
-	// Create frame header: 4 bytes length + 4 bytes version
-	header := make([]byte, FrameHeaderSize)
-	binary.BigEndian.PutUint32(header[0:4], uint32(len(data)))
-	binary.BigEndian.PutUint32(header[4:8], ProtocolVersion)
+	// Allocate the whole frame once: 4 bytes length + 4 bytes version + data
+	frame := make([]byte, FrameHeaderSize+len(data))
+	binary.BigEndian.PutUint32(frame[0:4], uint32(len(data)))
+	binary.BigEndian.PutUint32(frame[4:8], ProtocolVersion)
+	copy(frame[FrameHeaderSize:], data)
 
-	// Combine header and data
-	return append(header, data...), nil
+	return frame, nil
 }
 
 // DecodeMessage reads and decodes a framed JSON message from io.Reader.
@@ -14,12 +14,18 @@ Usage example:
 import sys
 import os
 import socket
+import struct
 from typing import Optional, Dict, Any
 
-# Add sbox-common to path for FramedJSONProtocol import
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../../sbox-common')))
+# Add sbox-common to path for FramedJSONProtocol import (once, even on reload)
+_SBOX_COMMON_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../../sbox-common'))
+if _SBOX_COMMON_PATH not in sys.path:
+    sys.path.append(_SBOX_COMMON_PATH)
 from sbox_common.protocols.socket.framed_json import FramedJSONProtocol
 
+# Precompiled frame header layout: 4 bytes length + 4 bytes version
+_FRAME_HEADER = struct.Struct('>II')
+
 
 class SocketClient:
     """Client for framed JSON protocol over Unix socket."""
@@ -90,13 +96,17 @@ class SocketClient:
         Returns:
             Received bytes.
         """
-        buf = b''
-        while len(buf) < n:
-            chunk = self.sock.recv(n - len(buf))
-            if not chunk:
+        # Receive straight into a preallocated buffer instead of
+        # concatenating chunks, which copies the data on every recv.
+        buf = bytearray(n)
+        view = memoryview(buf)
+        received = 0
+        while received < n:
+            count = self.sock.recv_into(view[received:], n - received)
+            if not count:
                 break
-            buf += chunk
-        return buf
+            received += count
+        return bytes(view[:received])
 
     def close(self) -> None:
         """Close the socket connection."""
@@ -113,5 +123,4 @@ class SocketClient:
         Returns:
             Tuple of (length, version).
         """
-        import struct
-        return struct.unpack('>II', header) 
\ No newline at end of file
+        return _FRAME_HEADER.unpack(header) 
\ No newline at end of file